@@ -1,8 +1,14 @@
+import asyncio
+import json
 import logging
 import os
+import threading
+from operator import itemgetter
+from pathlib import Path
 
-import praw
-import requests
+import cachetools
+import httpx
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 from google.adk.agents import Agent
 from google.adk.artifacts import InMemoryArtifactService
@@ -17,7 +23,65 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def get_reddit_news(subreddit: str, limit: int=3) -> dict[str, list[str]]:
+class RedditFetchError(Exception):
+    """Raised when fetching hot posts from Reddit fails (HTTP or network error)"""
+
+    pass
+
+
+## Shared HTTP client, created lazily on the first tool call and reused afterwards
+## so the keep-alive connection to reddit.com survives across requests
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared httpx.AsyncClient, creating it on first use.
+    Double-checked locking keeps concurrent tool calls from building
+    duplicate clients (and paying the TLS handshake twice).
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.AsyncClient(
+                    timeout=10,
+                    headers={"User-Agent": os.getenv("REDDIT_USER_AGENT")},
+                )
+    return _HTTP_CLIENT
+
+
+## Conditional-request cache: (subreddit, limit) -> (etag, titles). When Reddit
+## answers 304 Not Modified we can reuse the parsed titles without downloading
+## or reparsing the full listing. The lock matters because FastAPI can run
+## several tool calls concurrently.
+_ETAG_CACHE: dict[tuple[str, int], tuple[str, list[str]]] = {}
+_ETAG_CACHE_LOCK = threading.Lock()
+
+## Short-lived titles cache: (subreddit, limit) -> titles. Hot posts only change
+## on the order of minutes, so repeat tool calls within the TTL are answered
+## without touching Reddit at all (the ETag cache still saves bandwidth once
+## the TTL expires)
+_TITLE_CACHE: cachetools.TTLCache = cachetools.TTLCache(maxsize=128, ttl=60)
+_TITLE_CACHE_LOCK = threading.Lock()
+
+## Token bucket gating every outgoing Reddit call from this process, kept a
+## little under Reddit's 60 requests/minute free-tier budget so we never hit
+## a 429 and block a worker on the enforced back-off sleep
+_RATE_LIMITER = AsyncLimiter(55, 60)
+
+## How long a tool call may wait on the rate limiter before giving up and
+## answering with a "rate limited" message instead of tying up the event loop
+_RATE_LIMIT_WAIT_SECONDS = 2
+
+## Prebuilt accessors for pulling titles out of the listing JSON — avoids a
+## per-post lambda/attribute dance inside the hot parsing loop
+_GET_DATA = itemgetter("data")
+_GET_TITLE = itemgetter("title")
+
+
+async def get_reddit_news(subreddit: str, limit: int=3) -> dict[str, list[str]]:
     """
     Fetches top post titles from a specified subreddit using the Reddit API.
 
@@ -27,24 +91,74 @@ def get_reddit_news(subreddit: str, limit: int=3) -> dict[str, list[str]]:
 
     Returns:
         A dictionary with the subreddit name as key and a list of
-        post titles as value. Returns an error message if credentials are
-        missing, the subreddit is invalid, or an API error occurs.
+        post titles as value. Returns an error message if the subreddit
+        is invalid or an API error occurs.
     """
 
-    client_id = os.getenv("REDDIT_CLIENT_ID")
-    client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-    user_agent = os.getenv("REDDIT_USER_AGENT")
+    cache_key = (subreddit.lower(), limit)
 
+    with _TITLE_CACHE_LOCK:
+        fresh = _TITLE_CACHE.get(cache_key)
+    if fresh is not None:
+        return {subreddit: fresh}
+
+    # Cache miss — this call will hit Reddit, so take a rate-limit token
+    # first. Give up quickly rather than queueing behind a drained bucket.
     try:
-        reddit = praw.Reddit(
-            client_id=client_id, client_secret=client_secret, user_agent=user_agent
+        await asyncio.wait_for(
+            _RATE_LIMITER.acquire(), timeout=_RATE_LIMIT_WAIT_SECONDS
         )
-        sub_reddit = reddit.subreddit(subreddit)
-        posts = list(sub_reddit.hot(limit=limit))
-        titles = [post.title for post in posts]
+    except asyncio.TimeoutError:
+        logger.warning(f"--- Tool rate limited: skipping fetch for r/{subreddit} ---")
+        return {
+            subreddit: [
+                f"Request budget for the Reddit API is exhausted, please retry r/{subreddit} in a minute."
+            ]
+        }
+
+    try:
+        client = _get_http_client()
+
+        with _ETAG_CACHE_LOCK:
+            cached = _ETAG_CACHE.get(cache_key)
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+        try:
+            response = await client.get(
+                f"https://www.reddit.com/r/{subreddit}/hot.json?limit={limit}",
+                headers=headers,
+            )
+
+            # Nothing changed upstream, reuse the titles we already parsed
+            if response.status_code == 304 and cached:
+                with _TITLE_CACHE_LOCK:
+                    _TITLE_CACHE[cache_key] = cached[1]
+                return {subreddit: cached[1]}
+
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            # Wrap transport/status errors so fetch failures are
+            # distinguishable from bugs in the tool itself
+            raise RedditFetchError(f"fetching r/{subreddit} failed: {e}") from e
+
+        data = response.json()
+        titles = list(map(_GET_TITLE, map(_GET_DATA, data["data"]["children"])))
+
+        etag = response.headers.get("ETag")
+        if etag:
+            with _ETAG_CACHE_LOCK:
+                _ETAG_CACHE[cache_key] = (etag, titles)
+        with _TITLE_CACHE_LOCK:
+            _TITLE_CACHE[cache_key] = titles
+
         return {subreddit: titles}
+    except RedditFetchError as e:
+        logger.error(f"--- Tool error: {e} ---")
+        return {
+            subreddit: [f"Could not fetch posts from r/{subreddit} at the moment."]
+        }
     except Exception as e:
-        logger.errorint(f"--- Tool error: Unexpected error for r/{subreddit}: {e} ---")
+        logger.error(f"--- Tool error: Unexpected error for r/{subreddit}: {e} ---")
         return {
             subreddit: [
                 f"An unexpected error occurred while fetching from r/{subreddit}."
@@ -52,6 +166,102 @@ def get_reddit_news(subreddit: str, limit: int=3) -> dict[str, list[str]]:
         }
 
 
+## Local copy of the credentials payload so restarts don't block on the
+## credentials endpoint; revalidated with If-None-Match on each start
+_CREDS_CACHE_PATH = Path.home() / ".cache" / "reddit_agent" / "creds.json"
+
+
+def _fetch_credentials(server_domain: str) -> dict:
+    """
+    Fetches the credentials payload from the credentials endpoint.
+
+    Reads the locally cached copy first and revalidates it with
+    If-None-Match, so a restart costs a 304 instead of a full download.
+    The short timeout keeps a slow endpoint from hanging startup; if the
+    endpoint is unreachable, the cached copy is used as a fallback.
+
+    Args:
+        server_domain: Base URL of the server hosting the credentials endpoint.
+
+    Returns:
+        The credentials payload as a dictionary.
+    """
+    cached = None
+    try:
+        cached = json.loads(_CREDS_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        cached = None
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else None
+
+    try:
+        response = httpx.get(
+            f"{server_domain}:3100//credentials", timeout=3.0, headers=headers
+        )
+
+        # Credentials unchanged since last start, reuse the cached copy
+        if response.status_code == 304 and cached:
+            return cached["credentials"]
+
+        response.raise_for_status()
+        credentials = response.json()
+
+        try:
+            _CREDS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _CREDS_CACHE_PATH.write_text(
+                json.dumps(
+                    {
+                        "etag": response.headers.get("ETag"),
+                        "credentials": credentials,
+                    }
+                )
+            )
+        except OSError:
+            pass  # cache write failure is not fatal, next start just refetches
+
+        return credentials
+    except httpx.HTTPError as e:
+        if cached:
+            logger.warning(
+                f"--- Credentials endpoint unavailable ({e}), using cached copy ---"
+            )
+            return cached["credentials"]
+        raise
+
+
+async def get_reddit_news_batch(
+    subreddits: list[str], limit: int=3
+) -> dict[str, list[str]]:
+    """
+    Fetches top post titles from several subreddits in one call.
+
+    Fans the fetches out concurrently (capped at 5 in flight to stay
+    within Reddit's rate limit) so N subreddits cost roughly one round
+    trip instead of N sequential tool calls.
+
+    Args:
+        subreddits: The names of the subreddits to fetch news from.
+        limit: The maximum number of top posts to fetch per subreddit.
+
+    Returns:
+        A dictionary mapping each subreddit name to its list of post
+        titles (or an error message for subreddits that failed).
+    """
+
+    semaphore = asyncio.Semaphore(5)
+
+    async def _one(subreddit: str) -> dict[str, list[str]]:
+        async with semaphore:
+            return await get_reddit_news(subreddit, limit)
+
+    results = await asyncio.gather(*[_one(subreddit) for subreddit in subreddits])
+
+    merged: dict[str, list[str]] = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
 class RedditAgent:
 
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
@@ -62,15 +272,16 @@ class RedditAgent:
         Sets up session handling, memory and runner to execute task
         """
         server_domain = os.getenv("SERVER_DOMAIN") or "http://localhost"
-        self._credentials = requests.get(
-            f"{server_domain}:3100//credentials"
-        ).json()
+        self._credentials = _fetch_credentials(server_domain)
         for creds in self._credentials["data"]:
             os.environ[creds] = self._credentials["data"].get(creds)
         load_dotenv()
 
         self._agent = self._build_agent()
         self._user_id = "remote_reddit_agent"
+        ## Caches session objects we've already resolved, so repeat requests
+        ## on the same session skip the session service lookup
+        self._session_cache = cachetools.LRUCache(maxsize=256)
         ## Runner is used to manage the agent and its environment
         self._runner = Runner(
             app_name=self._agent.name,
@@ -93,20 +304,27 @@ class RedditAgent:
                 3. **Synthesize Output:** Take the exact list of titles returned by the tool.
                 4. **Format Response:** Present the information as a concise, bulleted list. Clearly state which subreddit(s) the information came from. 
                         If the tool indicates an error or an unknown subreddit, report that message directly.
-                5. **MUST CALL TOOL:** You **MUST** call the `get_reddit_news` tool with the identified subreddit(s).
+                5. **MUST CALL TOOL:** You **MUST** call the `get_reddit_news` tool with the identified subreddit.
+                        When the user asks about MULTIPLE subreddits, call the `get_reddit_news_batch` tool ONCE with the full list
+                        instead of calling `get_reddit_news` repeatedly.
                         DO NOT generate random summaries without calling the tool first.""",
-            tools=[get_reddit_news],
+            tools=[get_reddit_news, get_reddit_news_batch],
         )
 
-    def invoke(self, query: str, session_id: str) -> str:
+    def _get_or_create_session(self, session_id: str):
         """
-        Receives a user query about subreddit news and returns a response
+        Resolves a session for the given ID, creating it if needed.
+        Sessions we've seen before come from the local LRU cache instead
+        of another round through the session service
         Args:
-            query (str): The query to be processed
             session_id (str): The session ID for context of grouping messages
         Returns:
-            str: The response (subreddit posts) from the agent
+            The session object for this session ID
         """
+        session = self._session_cache.get(session_id)
+        if session is not None:
+            return session
+
         session = self._runner.session_service.get_session(
             app_name=self._agent.name, user_id=self._user_id, session_id=session_id
         )
@@ -116,23 +334,72 @@ class RedditAgent:
                 app_name=self._agent.name, user_id=self._user_id, session_id=session_id
             )
 
+        self._session_cache[session_id] = session
+        return session
+
+    def invoke(self, query: str, session_id: str) -> str:
+        """
+        Receives a user query about subreddit news and returns a response
+        Args:
+            query (str): The query to be processed
+            session_id (str): The session ID for context of grouping messages
+        Returns:
+            str: The response (subreddit posts) from the agent
+        """
+        session = self._get_or_create_session(session_id)
+
         ## Formatting user message in way the model can understand
         content = types.Content(role="user", parts=[types.Part.from_text(text=query)])
 
-        ## Run the aget using Runner and get the response events
-        events = list(
-            self._runner.run(
-                user_id=self._user_id, session_id=session_id, new_message=content
-            )
+        ## Run the agent using Runner, keeping only the last event — intermediate
+        ## events (tool calls, thoughts) can be freed as soon as they are seen
+        last_event = None
+        for event in self._runner.run(
+            user_id=self._user_id, session_id=session_id, new_message=content
+        ):
+            last_event = event
+
+        ## Fallback response if no events are returned
+        if not last_event or not last_event.content or not last_event.content.parts:
+            return "No response from agent"
+
+        ## Extract the response text from the final event's parts and join them
+        response_text = "\n".join(
+            [part.text for part in last_event.content.parts if part.text]
         )
 
+        return response_text
+
+    async def ainvoke(self, query: str, session_id: str) -> str:
+        """
+        Async variant of invoke. Runs the agent via the Runner's async API
+        so the FastAPI event loop is not blocked for the Reddit round trip
+        Args:
+            query (str): The query to be processed
+            session_id (str): The session ID for context of grouping messages
+        Returns:
+            str: The response (subreddit posts) from the agent
+        """
+        session = self._get_or_create_session(session_id)
+
+        ## Formatting user message in way the model can understand
+        content = types.Content(role="user", parts=[types.Part.from_text(text=query)])
+
+        ## Run the agent asynchronously, keeping only the last event — intermediate
+        ## events (tool calls, thoughts) can be freed as soon as they are seen
+        last_event = None
+        async for event in self._runner.run_async(
+            user_id=self._user_id, session_id=session_id, new_message=content
+        ):
+            last_event = event
+
         ## Fallback response if no events are returned
-        if not events or not events[-1].content or not events[-1].content.parts:
+        if not last_event or not last_event.content or not last_event.content.parts:
             return "No response from agent"
 
-        ## Extract the responses text from all events and join them
+        ## Extract the response text from the final event's parts and join them
         response_text = "\n".join(
-            [part.text for part in events[-1].content.parts if part.text]
+            [part.text for part in last_event.content.parts if part.text]
         )
 
         return response_text
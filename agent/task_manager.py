@@ -2,9 +2,10 @@ from agent.agent import RedditAgent
 from models.request import SendTaskRequest, SendTaskResponse
 from models.task import Message, TaskStatus, TextPart
 from server.task_manager import InMemoryTaskManager
-import json
 import logging
 
+import orjson
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -45,16 +46,20 @@ class RedditAgentTaskManager(InMemoryTaskManager):
         task = await self.upsert_task(request.params)
 
         # 2. Ask the agent for a response
-        response_text = self.agent.invoke(
+        response_text = await self.agent.ainvoke(
             self._get_user_query(request), request.params.session_id
         )
 
         # 3. Format the reply as a message object
         agent_response = Message(role="agent", parts=[TextPart(text=response_text)])
-        logger.info(f"\nOutgoing JSON Response:\n {json.dumps(agent_response.model_dump(), indent=2)}")
+        # Only pay for model_dump + serialization when debug logging is on;
+        # compact output avoids the doubled string size of indent=2
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\nOutgoing JSON Response:\n {orjson.dumps(agent_response.model_dump()).decode()}")
 
-        # 4. Save this response into task history
-        async with self.lock:
+        # 4. Save this response into task history (under the task's shard lock)
+        lock, _ = self._shard(task.id)
+        async with lock:
             task.status = TaskStatus(state="COMPLETED")
             task.history.append(agent_response)
 
@@ -1,14 +1,19 @@
-import json
 from typing import Any
 from uuid import uuid4
 
 import httpx
+import orjson
+from pydantic.type_adapter import TypeAdapter
 
 from models.agent import AgentCard
 from models.json_rpc import JSONRPCRequest
 from models.request import SendTaskRequest
 from models.task import Task, TaskSendParams
 
+# Built once at import time — validating through a cached TypeAdapter is
+# faster than the Task(**...) __init__ path for responses with long histories
+_TASK_ADAPTER = TypeAdapter(Task)
+
 
 class A2AClientHTTPError(Exception):
     """Raised when an HTTP request fails (e.g., bad server response)"""
@@ -31,25 +36,34 @@ class A2AClient:
         else:
             raise ValueError("Either agent card or url must be provided")
 
+        # One client for the lifetime of this A2AClient, so every send_task
+        # reuses the pooled connection instead of redoing DNS + TCP + TLS
+        self._client = httpx.AsyncClient(timeout=30)
+
+    async def aclose(self):
+        """Closes the underlying HTTP client. Call once when done with this A2AClient."""
+        await self._client.aclose()
+
     async def send_task(self, payload: dict[str, Any]):
         request = SendTaskRequest(id=uuid4().hex, params=TaskSendParams(**payload))
 
         print("\n----- Sending JSON RPC request -----\n")
 
         response = await self._send_request(request)
-        return Task(**response["result"])
+        return _TASK_ADAPTER.validate_python(response["result"])
 
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.url, json=request.model_dump(), timeout=30
-                )
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError as e:
-                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
-
-            except json.JSONDecodeError as e:
-                raise A2AClientJSONError(str(e)) from e
+        try:
+            response = await self._client.post(
+                self.url,
+                content=orjson.dumps(request.model_dump()),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        except httpx.HTTPStatusError as e:
+            raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+
+        except orjson.JSONDecodeError as e:
+            raise A2AClientJSONError(str(e)) from e
@@ -1,10 +1,12 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # This class defines what features or protocols the agent support which can be used by A2A clients
 #  to understand how to interact with the agent.
 class AgentCapabilities(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     streaming: bool = False
     pushNotifications: bool = False
     stateTransitionHistory: bool = False
@@ -12,6 +14,8 @@ class AgentCapabilities(BaseModel):
 
 # This class defines metadata about a single skill that the agent offers.
 class AgentSkill(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     name: str
     description: str | None = None
@@ -23,6 +27,8 @@ class AgentSkill(BaseModel):
 # This class provides core metadata about an agent which can be shared to other agents to describe
 # what the agent does, where to reach it, and what capabilities it supports.
 class AgentCard(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     name: str
     description: str
     url: str
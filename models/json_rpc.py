@@ -2,10 +2,13 @@
 from typing import Any, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JSONRPCMessage(BaseModel):
+    # Requests and responses are built once and never mutated afterwards
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     # Always specify the protocol version. "2.0" is the only valid value.
     jsonrpc: Literal["2.0"] = "2.0"
     id: int | str | None = Field(default_factory=lambda: uuid4().hex)
@@ -17,6 +20,8 @@ class JSONRPCRequest(JSONRPCMessage):
 
 
 class JSONRPCError(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     code: int
     message: str
     data: Any | None = None
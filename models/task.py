@@ -4,11 +4,13 @@ from enum import Enum
 from typing import Any, List, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Represents one part of a message, currently only plain text is allowed
 class TextPart(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     type: Literal["text"] = "text"  
     text: str                     
 
@@ -17,18 +19,25 @@ Part = TextPart
 
 # A message in the context of a task, either from the user or the agent
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role: Literal["user", "agent"] 
     parts: List[Part]
 
 
 # Describes the state of a task at a given moment
 class TaskStatus(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     state: str
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
 # The core unit of work in the Agent2Agent protocol
 class Task(BaseModel):
+    # Not frozen: status is reassigned and history is appended to in place
+    model_config = ConfigDict(extra="ignore")
+
     id: str
     status: TaskStatus
     history: List[Message]
@@ -36,6 +45,8 @@ class Task(BaseModel):
 
 # Used to identify a task, e.g., when canceling or querying
 class TaskIdParams(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     metadata: dict[str, Any] | None = None
 
@@ -48,6 +59,8 @@ class TaskQueryParams(TaskIdParams):
 
 # Parameters required to send a new task to an agent
 class TaskSendParams(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str                                
     session_id: str = Field(default_factory=lambda: uuid4().hex)
     message: Message
@@ -1,19 +1,27 @@
-import json
+import hashlib
 import logging
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from models.agent import AgentCard
 from models.json_rpc import InternalError, JSONRPCResponse
-from models.request import A2ARequest, SendTaskRequest
+from models.request import GetTaskRequest, SendTaskRequest
 from server.task_manager import TaskManager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Direct method -> model dispatch; skips the discriminated-union walk that
+# A2ARequest.validate_python does per request (the union stays in
+# models/request.py as the documented protocol surface)
+METHOD_MODELS = {
+    "tasks/send": SendTaskRequest,
+    "tasks/get": GetTaskRequest,
+}
+
 class A2AServer:
     def __init__(
         self,
@@ -37,10 +45,25 @@ class A2AServer:
         self.task_manager = task_manager
         self.app = FastAPI()
 
+        # The agent card only changes on process restart, so serialize it once
+        # and derive an ETag — discovery polls can then be answered with a 304
+        if agent_card:
+            self._agent_card_bytes = orjson.dumps(agent_card.model_dump(exclude_none=True))
+            self._agent_card_etag = f'"{hashlib.blake2b(self._agent_card_bytes, digest_size=8).hexdigest()}"'
+
         @self.app.get("/.well-known/agent.json")
-        async def get_agent_card():
+        async def get_agent_card(request: Request):
             """Returns the agent's metadata (GET /.well-known/agent.json)"""
-            return JSONResponse(self.agent_card.model_dump(exclude_none=True))
+            if request.headers.get("if-none-match") == self._agent_card_etag:
+                return Response(status_code=304, headers={"ETag": self._agent_card_etag})
+            return Response(
+                content=self._agent_card_bytes,
+                media_type="application/json",
+                headers={
+                    "ETag": self._agent_card_etag,
+                    "Cache-Control": "public, max-age=300",
+                },
+            )
 
         @self.app.post("/")
         async def handle_request(request: Request):
@@ -54,11 +77,14 @@ class A2AServer:
             """
             try:
                 # Step 1: Parse incoming JSON body
-                body = await request.json()
-                logger.info(f"\nIncoming JSON:\n {json.dumps(body, indent=2)}", )
+                body = orjson.loads(await request.body())
+                logger.info(f"\nIncoming JSON:\n {orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()}", )
 
-                # Step 2: Parse and validate request using discriminated union
-                json_rpc = A2ARequest.validate_python(body)
+                # Step 2: Look up the concrete request model by method and validate
+                request_cls = METHOD_MODELS.get(body.get("method"))
+                if request_cls is None:
+                    raise ValueError(f"Unsupported A2A method: {body.get('method')}")
+                json_rpc = request_cls.model_validate(body)
 
                 # Step 3: If it’s a send-task request, call the task manager to handle it
                 if isinstance(json_rpc, SendTaskRequest):
@@ -70,8 +96,8 @@ class A2AServer:
                 return self.create_response(result)
 
             except Exception as e:
-                logger.errorr(f"Error occurred while delegating task: \n Reason: {e}")
-                return JSONResponse(
+                logger.error(f"Error occurred while delegating task: \n Reason: {e}")
+                return ORJSONResponse(
                     JSONRPCResponse(id=None, error=InternalError(message=str(e))).model_dump(),
                     status_code=400,
                 )
@@ -84,17 +110,25 @@ class A2AServer:
             result: The response object (must be a JSONRPCResponse)
 
         Returns:
-            JSONResponse: Starlette-compatible HTTP response with JSON body
+            ORJSONResponse: Starlette-compatible HTTP response with JSON body
         """
         if isinstance(result, JSONRPCResponse):
-            return JSONResponse(
-                content=jsonable_encoder(result.model_dump(exclude_none=True))
-            )
+            # orjson serializes datetimes natively, so no jsonable_encoder pass
+            return ORJSONResponse(content=result.model_dump(exclude_none=True))
         else:
             raise ValueError("Invalid response type")
 
     def start(self):
-        """Starts the A2A server using uvicorn."""
+        """Starts the A2A server using uvicorn (uvloop event loop + httptools parser)."""
         if not self.agent_card or not self.task_manager:
             raise ValueError("Agent card and task manager are required")
-        uvicorn.run(self.app, host=self.host, port=self.port, timeout_keep_alive=150)
+        # Single worker on purpose: tasks, caches and sessions live in this
+        # process's memory, so extra workers would each see their own state
+        uvicorn.run(
+            self.app,
+            host=self.host,
+            port=self.port,
+            loop="uvloop",
+            http="httptools",
+            timeout_keep_alive=150,
+        )
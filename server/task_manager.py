@@ -1,6 +1,6 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from models.request import (
     GetTaskRequest,
@@ -51,11 +51,20 @@ class InMemoryTaskManager(TaskManager):
     Not for production: Data is lost when the app stops or restarts.
     """
 
+    # Number of (lock, dict) buckets the task store is split into
+    SHARD_COUNT = 16
+
     def __init__(self):
-        self.tasks: Dict[str, Task] = {}
-        self.lock = (
-            asyncio.Lock()
-        )  # Async lock to ensure two requests don't modify data at the same time
+        # Tasks are sharded across SHARD_COUNT buckets by task-id hash, each
+        # with its own lock, so requests for different tasks don't serialize
+        # on one global lock
+        self._shards: List[Tuple[asyncio.Lock, Dict[str, Task]]] = [
+            (asyncio.Lock(), {}) for _ in range(self.SHARD_COUNT)
+        ]
+
+    def _shard(self, task_id: str) -> Tuple[asyncio.Lock, Dict[str, Task]]:
+        """Returns the (lock, tasks) bucket responsible for the given task ID."""
+        return self._shards[hash(task_id) % self.SHARD_COUNT]
 
     # Create or update a task in memory
     async def upsert_task(self, params: TaskSendParams) -> Task:
@@ -68,21 +77,30 @@ class InMemoryTaskManager(TaskManager):
         Returns:
             Task – the newly created or updated task
         """
-        async with self.lock:
-            task = self.tasks.get(params.id)
-
-            if task is None:
-                # If task doesn't exist, create it with a "submitted" status
-                task = Task(
-                    id=params.id,
-                    status=TaskStatus(state=TaskState.SUBMITTED),
-                    history=[params.message],
-                )
-                self.tasks[params.id] = task
-            else:
+        lock, tasks = self._shard(params.id)
+
+        async with lock:
+            task = tasks.get(params.id)
+
+            if task is not None:
                 # If task exists, add the new message to its history
                 task.history.append(params.message)
-
+                return task
+
+        # Task doesn't exist: build it with a "submitted" status OUTSIDE the
+        # lock, so concurrent sends don't serialize on Pydantic validation
+        new_task = Task(
+            id=params.id,
+            status=TaskStatus(state=TaskState.SUBMITTED),
+            history=[params.message],
+        )
+
+        async with lock:
+            task = tasks.setdefault(params.id, new_task)
+            if task is not new_task:
+                # Another coroutine inserted this task while we were
+                # validating — append our message to the winner instead
+                task.history.append(params.message)
             return task
 
     async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
@@ -106,9 +124,11 @@ class InMemoryTaskManager(TaskManager):
         Returns:
             GetTaskResponse – contains the task if found, or an error message
         """
-        async with self.lock:
-            query: TaskQueryParams = request.params
-            task = self.tasks.get(query.id)
+        query: TaskQueryParams = request.params
+        lock, tasks = self._shard(query.id)
+
+        async with lock:
+            task = tasks.get(query.id)
 
             if not task:
                 # If task not found, return a structured error
@@ -116,13 +136,17 @@ class InMemoryTaskManager(TaskManager):
                     id=request.id, error={"message": "Task not found"}
                 )
 
-            # Optional: Trim the history to only show the last N messages
-            task_copy = task.model_copy()  # Make a copy so we don't affect the original
+            # Optional: Trim the history to only show the last N messages.
+            # The stored task is already validated, so build the copy with
+            # model_construct instead of model_copy — O(1) instead of
+            # revalidating every message in a long history.
             if query.historyLength is not None:
-                task_copy.history = task_copy.history[
-                    -query.historyLength :
-                ]  # Get last N messages
+                history = task.history[-query.historyLength :]  # Get last N messages
             else:
-                task_copy.history = task_copy.history
+                history = task.history
+
+            task_copy = Task.model_construct(
+                id=task.id, status=task.status, history=history
+            )
 
             return GetTaskResponse(id=request.id, result=task_copy)